@@ -1,6 +1,7 @@
+import io
 import streamlit as st
 import pandas as pd
-from translation import Translator, evaluate_dataset
+from translation import get_translator, evaluate_dataset, scrape_text_cached
 from dotenv import load_dotenv
 import os
 
@@ -14,8 +15,14 @@ if missing_keys:
     st.error(f"Missing API keys: {', '.join(missing_keys)}. Please check your .env file.")
     st.stop()
 
-# initialize translator instance
-translator = Translator()
+# write a dataframe to csv bytes straight into a buffer to avoid an intermediate string copy
+def csv_bytes(df):
+    buffer = io.BytesIO()
+    df.to_csv(buffer, index=False, encoding="utf-8-sig")
+    return buffer.getvalue()
+
+# get the cached translator instance
+translator = get_translator()
 
 # set up streamlit app title
 st.title("Translation Engine App - Version 1 (API Models)")
@@ -38,7 +45,7 @@ else:
     if st.button("Scrape and Preview"):
         # scrape text from the provided url
         with st.spinner("Scraping website..."):
-            scraped_text = translator.scrape_text(url)
+            scraped_text = scrape_text_cached(url)
             if not scraped_text.startswith("Error"):
                 st.session_state.scraped_text = scraped_text
                 st.text_area("Preview Scraped Content", scraped_text, height=300)
@@ -65,25 +72,26 @@ if st.button("Translate"):
     if not text or text.startswith("Error"):
         st.error("Please enter valid text or scrape a webpage first.")
     else:
-        results = {}
         with st.spinner("Translating..."):
-            for model in selected_models:
-                for lang in selected_languages:
-                    translation = translator.translate(text, lang, model)
-                    results[f"{model} - {lang}"] = translation
+            # translate every model/language pair concurrently on the shared event loop
+            pairs = [(model, lang) for model in selected_models for lang in selected_languages]
+            translations = translator.translate_all([(text, lang, model) for model, lang in pairs])
+            results = {f"{model} - {lang}": translation for (model, lang), translation in zip(pairs, translations)}
         data = {"Original Text": [text]}
         data.update(results)
-        df = pd.DataFrame(data)
-        st.dataframe(df)
-
-        # offer csv download of translations
-        csv = df.to_csv(index=False, encoding="utf-8-sig")
-        st.download_button(
-            "Download Translations CSV",
-            data=csv,
-            file_name="translations.csv",
-            mime="text/csv"
-        )
+        # keep results and their csv across reruns so other widget interactions do not recompute them
+        st.session_state.results_df = pd.DataFrame(data)
+        st.session_state.results_csv = csv_bytes(st.session_state.results_df)
+
+# display the latest translations and offer csv download
+if "results_df" in st.session_state:
+    st.dataframe(st.session_state.results_df)
+    st.download_button(
+        "Download Translations CSV",
+        data=st.session_state.results_csv,
+        file_name="translations.csv",
+        mime="text/csv"
+    )
 
 # upload translated csv and evaluate against google translate
 st.header("Evaluate with Dataset")
@@ -101,7 +109,24 @@ uploaded_file = st.file_uploader("", type="csv")
 
 if uploaded_file and st.button("Evaluate Dataset"):
     with st.spinner("Evaluating translations..."):
-        evaluate_dataset(uploaded_file)
+        evaluation_df = evaluate_dataset(uploaded_file)
+    # keep results and their csv across reruns so other widget interactions do not recompute them
+    if evaluation_df is not None:
+        st.session_state.evaluation_df = evaluation_df
+        st.session_state.evaluation_csv = csv_bytes(evaluation_df)
+    else:
+        st.session_state.pop("evaluation_df", None)
+        st.session_state.pop("evaluation_csv", None)
+
+# display the latest evaluation results and offer csv download
+if "evaluation_df" in st.session_state:
+    st.dataframe(st.session_state.evaluation_df)
+    st.download_button(
+        "Download Evaluation CSV",
+        data=st.session_state.evaluation_csv,
+        file_name="evaluation.csv",
+        mime="text/csv"
+    )
 
 # display language prioritization strategy
 st.header("Language Prioritization for Cost Optimization")
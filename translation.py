@@ -1,12 +1,19 @@
 import re
+import regex
+import sys
+import numpy as np
 import pandas as pd
 import nltk
 import logging
 import time
-from functools import wraps
-from nltk.tokenize import word_tokenize, sent_tokenize
-from nltk.translate.bleu_score import sentence_bleu
-from nltk.translate.meteor_score import meteor_score
+import random
+import asyncio
+import inspect
+import hashlib
+import threading
+from functools import wraps, lru_cache
+from nltk.tokenize import sent_tokenize
+from nltk.translate.meteor_score import single_meteor_score
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
@@ -15,7 +22,7 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
 from selenium.common.exceptions import TimeoutException, WebDriverException
 from webdriver_manager.chrome import ChromeDriverManager
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 import openai
 import anthropic
 import streamlit as st
@@ -23,12 +30,24 @@ import os
 import undetected_chromedriver as uc
 from deep_translator import GoogleTranslator
 import cloudscraper
+import diskcache
 
-# download required nltk resources silently
-nltk.download("punkt", quiet=True)
-nltk.download("punkt_tab", quiet=True)
-nltk.download("wordnet", quiet=True)
-nltk.download("omw-1.4", quiet=True)
+# download required nltk resources silently, skipping any already installed
+@lru_cache(maxsize=None)
+def ensure_nltk_resources():
+    """Download required NLTK resources that are not already installed."""
+    for package, path in [
+        ("punkt", "tokenizers/punkt"),
+        ("punkt_tab", "tokenizers/punkt_tab"),
+        ("wordnet", "corpora/wordnet"),
+        ("omw-1.4", "corpora/omw-1.4"),
+    ]:
+        try:
+            nltk.data.find(path)
+        except LookupError:
+            nltk.download(package, quiet=True)
+
+ensure_nltk_resources()
 
 # configure logging for debugging
 logging.basicConfig(
@@ -40,60 +59,179 @@ logging.basicConfig(
     ]
 )
 
-# define retry decorator for robust api calls
-def retry(retries=3, delay=5):
+# transient api errors worth retrying, anything else fails immediately
+# anthropic raises its own classes for 503 and 529, which older sdks do not define
+RETRYABLE_ERRORS = tuple(error for error in (
+    openai.APIConnectionError, openai.RateLimitError, openai.InternalServerError,
+    anthropic.APIConnectionError, anthropic.RateLimitError, anthropic.InternalServerError,
+    getattr(anthropic, "ServiceUnavailableError", None), getattr(anthropic, "OverloadedError", None)
+) if error is not None)
+
+# longest wait honored from a Retry-After header
+MAX_RETRY_AFTER = 60
+
+# compute how long to wait before the next attempt
+def _retry_delay(error, attempt, delay):
+    """Honor a Retry-After header on rate limits, otherwise use jittered exponential backoff."""
+    response = getattr(error, "response", None)
+    if isinstance(error, (openai.RateLimitError, anthropic.RateLimitError)) and response is not None:
+        try:
+            return min(float(response.headers.get("retry-after")), MAX_RETRY_AFTER)
+        except (TypeError, ValueError):
+            pass
+    # jitter de-synchronizes retries from many concurrent calls
+    return delay * (2 ** attempt) * random.uniform(0.5, 1.5)
+
+# define retry decorator for robust api calls, supporting both sync and async functions
+def retry(retries=3, delay=5, retry_on=RETRYABLE_ERRORS):
     def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                attempt = 0
+                while attempt < retries:
+                    try:
+                        return await func(*args, **kwargs)
+                    except retry_on as e:
+                        attempt += 1
+                        if attempt == retries:
+                            logging.error(f"Failed after {retries} attempts in {func.__name__}: {e}")
+                            raise Exception(f"Failed after {retries} attempts: {e}")
+                        wait = _retry_delay(e, attempt, delay)
+                        logging.warning(f"Attempt {attempt} failed for {func.__name__}: {e}. Retrying in {wait:.1f}s...")
+                        await asyncio.sleep(wait)
+            return async_wrapper
+
         @wraps(func)
         def wrapper(*args, **kwargs):
             attempt = 0
             while attempt < retries:
                 try:
                     return func(*args, **kwargs)
-                except Exception as e:
+                except retry_on as e:
                     attempt += 1
                     if attempt == retries:
                         logging.error(f"Failed after {retries} attempts in {func.__name__}: {e}")
                         raise Exception(f"Failed after {retries} attempts: {e}")
-                    logging.warning(f"Attempt {attempt} failed for {func.__name__}: {e}. Retrying in {delay * (2 ** attempt)}s...")
-                    time.sleep(delay * (2 ** attempt))
+                    wait = _retry_delay(e, attempt, delay)
+                    logging.warning(f"Attempt {attempt} failed for {func.__name__}: {e}. Retrying in {wait:.1f}s...")
+                    time.sleep(wait)
         return wrapper
     return decorator
 
-# initialize api clients with environment variables
-openai_client = openai.OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-deepseek_client = openai.OpenAI(api_key=os.getenv("DEEPSEEK_API_KEY"), base_url="https://api.deepseek.com/v1")
-anthropic_client = anthropic.Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
+# precompiled patterns for placeholders and trailing notes in model responses
+_PH_RE = re.compile(r"\[.*?\]")
+_PH_MARKER_RE = re.compile(r"__PH(\d+)__")
+_NOTES_RE = re.compile(r'### Notes:.*$', re.DOTALL)
+# lightweight word tokenizer for scoring translations, keeping combining marks
+# (devanagari vowel signs and virama, arabic diacritics) and grouped numbers inside tokens
+_TOK_RE = regex.compile(r"\p{N}+(?:[.,]\p{N}+)+|[\p{L}\p{M}\p{N}_]+|[^\p{L}\p{M}\p{N}\s]")
+
+# persistent cache for translations keyed by content hash
+translation_cache = diskcache.Cache(".trans_cache")
+
+# build a content-addressed cache key from normalized parts
+def _cache_key(*parts):
+    normalized = "|".join(" ".join(str(part).split()) for part in parts)
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).hexdigest()
+
+# request timeout for the http clients of every provider
+HTTP_TIMEOUT = 60
+
+# run one event loop in a background thread for the app's lifetime
+@st.cache_resource
+def get_event_loop():
+    """Start an event loop in a daemon thread so async clients and connections outlive each rerun."""
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="translation-event-loop", daemon=True).start()
+    return loop
+
+# initialize api clients with environment variables once for the app's lifetime
+@st.cache_resource
+def get_clients():
+    """Initialize async API clients once so their connection pools are reused across reruns."""
+    # each sdk builds its own http/2 client, openai's pool is shared by openai and deepseek
+    openai_http = openai.DefaultAsyncHttpxClient(http2=True, timeout=HTTP_TIMEOUT)
+    anthropic_http = anthropic.DefaultAsyncHttpxClient(http2=True, timeout=HTTP_TIMEOUT)
+    return {
+        "OpenAI": openai.AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"), http_client=openai_http),
+        "DeepSeek": openai.AsyncOpenAI(api_key=os.getenv("DEEPSEEK_API_KEY"), base_url="https://api.deepseek.com/v1", http_client=openai_http),
+        "Anthropic": anthropic.AsyncAnthropic(api_key=os.getenv("ANTHROPIC_API_KEY"), http_client=anthropic_http)
+    }
+
+# maximum number of concurrent requests allowed per provider
+MAX_CONCURRENT_REQUESTS = 4
+
+# seconds the shared chromedriver may sit unused before it is quit
+DRIVER_IDLE_TIMEOUT = 300
 
 # translator class to handle translations using different models
 class Translator:
     MODELS = {
-        "OpenAI": {"client": openai_client, "model": "gpt-4o"},
-        "DeepSeek": {"client": deepseek_client, "model": "deepseek-reasoner"},
-        "Anthropic": {"client": anthropic_client, "model": "claude-3-5-sonnet-20240620"}
+        "OpenAI": {"model": "gpt-4o"},
+        "DeepSeek": {"model": "deepseek-reasoner"},
+        "Anthropic": {"model": "claude-3-5-sonnet-20240620"}
     }
 
+    def __init__(self):
+        self.clients = get_clients()
+        self.loop = get_event_loop()
+        # per-provider semaphores to respect rate limits, created on the event loop thread
+        self.semaphores = {}
+        # one headless chrome shared by all sessions, quit after sitting idle
+        self._driver = None
+        self._driver_lock = threading.Lock()
+        self._driver_last_used = 0.0
+
     # translate text to the specified language using the given model
     def translate(self, text, lang, model_name):
         """Translate text to the specified language using the given model."""
+        return self.translate_all([(text, lang, model_name)])[0]
+
+    # translate many (text, lang, model_name) items concurrently, blocking until all are done
+    def translate_all(self, items):
+        """Translate many (text, lang, model_name) items concurrently, blocking until all are done."""
+        return asyncio.run_coroutine_threadsafe(self.translate_all_async(items), self.loop).result()
+
+    # translate many (text, lang, model_name) items concurrently on the shared event loop
+    async def translate_all_async(self, items):
+        """Translate many (text, lang, model_name) items concurrently on the shared event loop."""
+        return await asyncio.gather(*[
+            self.translate_async(text, lang, model_name) for text, lang, model_name in items
+        ])
+
+    # translate text to the specified language using the given model on the shared event loop
+    async def translate_async(self, text, lang, model_name):
+        """Translate text to the specified language using the given model on the shared event loop."""
         if model_name not in self.MODELS:
             logging.error(f"Invalid model name: {model_name}")
             return f"Error: Invalid model name {model_name}"
 
-        client = self.MODELS[model_name]["client"]
+        # return cached translation if this exact request was already served
+        key = _cache_key(model_name, lang, text)
+        cached = translation_cache.get(key)
+        if cached is not None:
+            logging.info(f"Cache hit for {model_name} to {lang}")
+            return cached
+
+        client = self.clients[model_name]
         model = self.MODELS[model_name]["model"]
 
-        # preserve placeholders before translation
+        # strip placeholders into opaque markers and restore them locally after translation
         text_no_ph, placeholders = self._preserve_placeholders(text)
-        prompt = f"Translate the following text to {lang}, preserving all placeholders (e.g., [dataPoints], [brokerName]) exactly as they appear: '{text_no_ph}'"
+        prompt = self._build_prompt(text_no_ph, lang)
 
         logging.info(f"Translating with {model_name} to {lang}: '{text_no_ph}'")
 
         try:
-            translation = self._call_api(client, model, prompt, model_name)
-            # ensure proper encoding of translation
-            translation = translation.encode().decode('utf-8', errors='replace')
+            if model_name not in self.semaphores:
+                self.semaphores[model_name] = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+            async with self.semaphores[model_name]:
+                translation = await self._call_api(client, model, prompt, model_name)
             restored_translation = self._restore_placeholders(translation, placeholders)
             logging.info(f"Translation successful: '{restored_translation}'")
+            if not restored_translation.startswith("Error:"):
+                translation_cache.set(key, restored_translation)
             return restored_translation
         except Exception as e:
             logging.error(f"Translation failed for {model_name} to {lang}: {e}")
@@ -101,79 +239,148 @@ class Translator:
 
     # helper method to make api calls with retry logic
     @retry()
-    def _call_api(self, client, model, prompt, model_name):
+    async def _call_api(self, client, model, prompt, model_name):
         """Helper method to make API calls with retry logic."""
         if model_name in ["OpenAI", "DeepSeek"]:
-            response = client.chat.completions.create(
+            response = await client.chat.completions.create(
                 model=model,
                 messages=[{"role": "user", "content": prompt}]
             )
             response_text = response.choices[0].message.content
         elif model_name == "Anthropic":
-            response = client.messages.create(
+            response = await client.messages.create(
                 model=model,
                 max_tokens=1024,
                 messages=[{"role": "user", "content": prompt}]
             )
             response_text = response.content[0].text if isinstance(response.content, list) else response.content
-        
-        # remove any notes section from response
-        translation = re.sub(r'### Notes:.*$', '', response_text, flags=re.DOTALL).strip()
-        return translation
+
+        return self._clean_response(response_text)
+
+    # build the prompt for translating placeholder-free text
+    def _build_prompt(self, text_no_ph, lang):
+        """Build the prompt for translating placeholder-free text."""
+        return f"Translate to {lang}. Output only the translation, no notes. Text: {text_no_ph}"
+
+    # remove any notes section the model still adds despite the prompt
+    def _clean_response(self, response_text):
+        """Remove any notes section the model still adds despite the prompt."""
+        return _NOTES_RE.sub('', response_text).strip()
 
     # replace placeholders with temporary markers
     def _preserve_placeholders(self, text):
         """Replace placeholders with temporary markers."""
-        placeholders = re.findall(r"\[.*?\]", text)
-        for i, ph in enumerate(placeholders):
-            text = text.replace(ph, f"__PH{i}__")
-        return text, placeholders
+        placeholders = []
+
+        def repl(match):
+            placeholders.append(match.group(0))
+            return f"__PH{len(placeholders) - 1}__"
+
+        return _PH_RE.sub(repl, text), placeholders
 
     # restore original placeholders in translated text
     def _restore_placeholders(self, text, placeholders):
         """Restore original placeholders in the translated text."""
-        for i, ph in enumerate(placeholders):
-            text = text.replace(f"__PH{i}__", ph)
-        return text
+        def repl(match):
+            i = int(match.group(1))
+            return placeholders[i] if i < len(placeholders) else match.group(0)
+
+        return _PH_MARKER_RE.sub(repl, text)
+
+    # extract whitespace-normalized text from the main content of an html page
+    def _extract_main_text(self, html):
+        """Extract whitespace-normalized text from the main content of an HTML page."""
+        tree = LexborHTMLParser(html)
+        # drop script and style contents, which are not part of the readable text
+        tree.strip_tags(["script", "style", "noscript"])
+        main_content = tree.css_first("main") or tree.css_first("article") or tree.body or tree.root
+        text = main_content.text(separator=' ', strip=True) if main_content else ""
+        return ' '.join(text.split())
+
+    # get the shared chromedriver, launching it on first use
+    def _get_driver(self):
+        """Get the shared chromedriver, launching it on first use. Callers must hold the driver lock."""
+        if self._driver is None:
+            options = Options()
+            options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
+            options.add_argument("--headless")
+            options.add_argument("--no-sandbox")
+            options.add_argument("--disable-dev-shm-usage")
+            options.add_argument("--window-size=1920,1080")
+            self._driver = uc.Chrome(options=options)
+            self._driver.set_page_load_timeout(60)
+        return self._driver
+
+    # quit and forget the shared chromedriver
+    def _quit_driver(self):
+        """Quit and forget the shared chromedriver. Callers must hold the driver lock."""
+        driver, self._driver = self._driver, None
+        if driver is not None:
+            try:
+                driver.quit()
+            except Exception as e:
+                logging.warning(f"Failed to quit chromedriver: {e}")
+
+    # quit the shared chromedriver once it has been idle for the timeout
+    def _schedule_driver_shutdown(self):
+        """Quit the shared chromedriver once it has been idle for DRIVER_IDLE_TIMEOUT seconds."""
+        self._driver_last_used = time.monotonic()
+
+        def shutdown_if_idle():
+            with self._driver_lock:
+                if self._driver is not None and time.monotonic() - self._driver_last_used >= DRIVER_IDLE_TIMEOUT:
+                    logging.info("Quitting idle chromedriver")
+                    self._quit_driver()
+
+        timer = threading.Timer(DRIVER_IDLE_TIMEOUT, shutdown_if_idle)
+        timer.daemon = True
+        timer.start()
+
+    # scrape a url with the shared chromedriver, returning none on failure
+    def _scrape_with_driver(self, url):
+        """Scrape a URL with the shared chromedriver, returning None on failure."""
+        # one scrape at a time, the webdriver is not safe to share between threads
+        with self._driver_lock:
+            try:
+                driver = self._get_driver()
+                driver.get(url)
+                WebDriverWait(driver, 30).until(
+                    EC.presence_of_element_located((By.TAG_NAME, "body"))
+                )
+                # wait for cloudflare verification only if a challenge is shown
+                try:
+                    WebDriverWait(driver, 10).until_not(
+                        EC.presence_of_element_located((By.XPATH, "//*[contains(text(),'Verify you are human')]"))
+                    )
+                except TimeoutException:
+                    pass
+                html = driver.page_source
+                if "Verify you are human" in html:
+                    logging.warning(f"Cloudflare verification detected with undetected-chromedriver at {url}")
+                    raise WebDriverException("Cloudflare verification detected")
+                text = self._extract_main_text(html)
+                if not text:
+                    logging.warning(f"No content found with undetected-chromedriver at {url}")
+                    raise ValueError("No content found")
+                logging.info(f"Successfully scraped content with undetected-chromedriver from {url}")
+                return text
+            except Exception as e:
+                logging.error(f"undetected-chromedriver failed for {url}: {e}")
+                # discard the driver so the next scrape starts from a clean browser
+                self._quit_driver()
+                return None
+            finally:
+                if self._driver is not None:
+                    self._schedule_driver_shutdown()
 
     # scrape text content from a webpage url, focusing on main content
     def scrape_text(self, url):
         """Scrape text content from a webpage URL, focusing on main content."""
         # attempt scraping with undetected-chromedriver first
         logging.info(f"Attempting to scrape {url} with undetected-chromedriver")
-        options = Options()
-        options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
-        options.add_argument("--headless")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--window-size=1920,1080")
-
-        try:
-            driver = uc.Chrome(options=options)
-            driver.set_page_load_timeout(60)
-            driver.get(url)
-            WebDriverWait(driver, 30).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
-            time.sleep(5)  # allow time for cloudflare verification
-            html = driver.page_source
-            if "Verify you are human" in html:
-                logging.warning(f"Cloudflare verification detected with undetected-chromedriver at {url}")
-                raise WebDriverException("Cloudflare verification detected")
-            soup = BeautifulSoup(html, "html.parser")
-            main_content = soup.find('main') or soup.find('article') or soup.find('body')
-            text = main_content.get_text(separator=' ', strip=True) if main_content else soup.get_text(separator=' ', strip=True)
-            text = ' '.join(text.split())
-            if not text:
-                logging.warning(f"No content found with undetected-chromedriver at {url}")
-                raise ValueError("No content found")
-            logging.info(f"Successfully scraped content with undetected-chromedriver from {url}")
+        text = self._scrape_with_driver(url)
+        if text is not None:
             return text
-        except Exception as e:
-            logging.error(f"undetected-chromedriver failed for {url}: {e}")
-        finally:
-            if 'driver' in locals():
-                driver.quit()
 
         # fallback to cloudscraper if chromedriver fails
         logging.info(f"Falling back to cloudscraper for {url}")
@@ -181,10 +388,7 @@ class Translator:
             scraper = cloudscraper.create_scraper()
             response = scraper.get(url)
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                main_content = soup.find('main') or soup.find('article') or soup.find('body')
-                text = main_content.get_text(separator=' ', strip=True) if main_content else soup.get_text(separator=' ', strip=True)
-                text = ' '.join(text.split())
+                text = self._extract_main_text(response.text)
                 if not text:
                     logging.warning(f"No content found with cloudscraper at {url}")
                     return "Error: No content found."
@@ -197,9 +401,99 @@ class Translator:
             logging.error(f"cloudscraper failed for {url}: {e}")
             return f"Error: {str(e)}"
 
+# get the translator shared by all reruns and sessions
+@st.cache_resource
+def get_translator():
+    """Get the Translator shared by all reruns and sessions."""
+    return Translator()
+
+# scrape a url, raising on failure so error results are not cached
+@st.cache_data(ttl=3600, show_spinner=False)
+def _scrape_text_cached(url):
+    text = get_translator().scrape_text(url)
+    if text.startswith("Error"):
+        raise RuntimeError(text)
+    return text
+
+# scrape text from a url, reusing content scraped within the last hour
+def scrape_text_cached(url):
+    """Scrape text from a URL, reusing content scraped within the last hour."""
+    try:
+        return _scrape_text_cached(url)
+    except RuntimeError as e:
+        return str(e)
+
+# translate sentences with google translate, caching each one as soon as it arrives
+def _google_translate_sentences(translator, lang_code, sentences):
+    """Translate sentences with Google Translate, caching each one as soon as it arrives."""
+    translations = {}
+    # send each distinct sentence once, cached sentences are not sent at all
+    for sentence in dict.fromkeys(sentences):
+        key = _cache_key("Google", lang_code, sentence)
+        translation = translation_cache.get(key)
+        if translation is None:
+            translation = translator.translate(sentence)
+            if translation and not translation.startswith("Error:"):
+                translation_cache.set(key, translation)
+        translations[sentence] = translation
+    return ' '.join(translations[sentence] for sentence in sentences)
+
+# compute sentence-level bleu for many hypothesis/reference pairs in one vectorized pass
+def batch_sentence_bleu(references, hypotheses, max_n=4):
+    """Compute sentence-level BLEU for many pairs at once, matching nltk's sentence_bleu defaults."""
+    batch = len(hypotheses)
+    if batch == 0:
+        return []
+
+    # map every token in the batch to an integer id, padding with -1
+    vocab = {}
+    def to_ids(tokens_list):
+        lengths = np.array([len(tokens) for tokens in tokens_list], dtype=np.int64)
+        ids = np.full((len(tokens_list), max(int(lengths.max()), max_n)), -1, dtype=np.int64)
+        for i, tokens in enumerate(tokens_list):
+            ids[i, :len(tokens)] = [vocab.setdefault(token, len(vocab)) for token in tokens]
+        return ids, lengths
+
+    hyp_ids, hyp_lens = to_ids(hypotheses)
+    ref_ids, ref_lens = to_ids(references)
+    rows = np.arange(batch)
+
+    numerators = np.zeros((max_n, batch))
+    denominators = np.zeros((max_n, batch))
+    for n in range(1, max_n + 1):
+        # extract all n-grams in parallel, tagging each with its row index
+        def ngrams(ids, lengths):
+            windows = np.lib.stride_tricks.sliding_window_view(ids, n, axis=1)
+            valid = np.arange(windows.shape[1])[None, :] < (lengths - n + 1)[:, None]
+            grams = windows[valid]
+            return np.column_stack([np.broadcast_to(rows[:, None], valid.shape)[valid], grams])
+
+        hyp_grams = ngrams(hyp_ids, hyp_lens)
+        ref_grams = ngrams(ref_ids, ref_lens)
+        # clip hypothesis n-gram counts by reference counts over a shared key space
+        keys, inverse = np.unique(np.vstack([hyp_grams, ref_grams]), axis=0, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        hyp_counts = np.bincount(inverse[:len(hyp_grams)], minlength=len(keys))
+        ref_counts = np.bincount(inverse[len(hyp_grams):], minlength=len(keys))
+        clipped = np.minimum(hyp_counts, ref_counts)
+        numerators[n - 1] = np.bincount(keys[:, 0], weights=clipped, minlength=batch)
+        denominators[n - 1] = np.maximum(1, hyp_lens - n + 1)
+
+    # combine precisions with the brevity penalty, zero precisions fall back to the smallest float like nltk
+    with np.errstate(divide="ignore"):
+        precisions = np.where(numerators > 0, numerators / denominators, sys.float_info.min)
+        log_precisions = np.log(precisions).sum(axis=0) / max_n
+        brevity_penalty = np.where(
+            hyp_lens > ref_lens, 1.0,
+            np.exp(1 - ref_lens / np.maximum(hyp_lens, 1))
+        )
+    scores = brevity_penalty * np.exp(log_precisions)
+    scores[(numerators[0] == 0) | (hyp_lens == 0)] = 0.0
+    return scores.tolist()
+
 # evaluate translations in csv against google translate
 def evaluate_dataset(uploaded_file):
-    """Evaluate translations in the uploaded CSV against Google Translate."""
+    """Evaluate translations in the uploaded CSV against Google Translate, returning the results DataFrame."""
     # load csv file
     try:
         df = pd.read_csv(uploaded_file)
@@ -223,79 +517,88 @@ def evaluate_dataset(uploaded_file):
         "Spanish": "es", "French": "fr", "German": "de", "Japanese": "ja",
         "Arabic": "ar", "Hindi": "hi", "Portuguese": "pt"
     }
+    bleu_references = []
+    bleu_hypotheses = []
     total_rows = len(df)
     progress_bar = st.progress(0)
 
+    # parse translation column names once, warning about any that cannot be evaluated
+    col_meta = []
+    for col in translation_columns:
+        parts = col.split(" - ")
+        if len(parts) != 2:
+            logging.warning(f"Invalid column name format: {col}")
+            st.warning(f"Invalid column name format: {col}. Skipping.")
+            continue
+        model, lang_name = parts
+        if lang_name not in language_codes:
+            logging.warning(f"Unknown language: {lang_name}")
+            st.warning(f"Unknown language: {lang_name}. Skipping.")
+            continue
+        col_meta.append((col, model, lang_name, df[col].astype(str).tolist()))
+    english_texts = df[english_column].tolist()
+
+    # reuse one google translator per target language across all rows
+    translators = {code: GoogleTranslator(source='en', target=code) for code in language_codes.values()}
+
     # iterate over each row and column for evaluation
-    for index, row in df.iterrows():
-        english_text = row[english_column]
-        logging.debug(f"Evaluating row {index + 1}/{total_rows}: '{english_text}'")
-        for col in translation_columns:
-            parts = col.split(" - ")
-            if len(parts) != 2:
-                logging.warning(f"Invalid column name format: {col}")
-                st.warning(f"Invalid column name format: {col}. Skipping.")
-                continue
-            model, lang_name = parts
-            if lang_name not in language_codes:
-                logging.warning(f"Unknown language: {lang_name}")
-                st.warning(f"Unknown language: {lang_name}. Skipping.")
-                continue
-            lang_code = language_codes[lang_name]
-            app_translation = str(row[col])
+    for position, english_text in enumerate(english_texts):
+        logging.debug(f"Evaluating row {position + 1}/{total_rows}: '{english_text}'")
+        # google baseline and its tokens per language, shared by every model column in this row
+        google_cache = {}
+        sentences = None
+        for col, model, lang_name, app_translations in col_meta:
+            app_translation = app_translations[position]
 
             if app_translation.startswith("Error"):
                 logging.warning(f"Skipping evaluation for {col} due to translation error: {app_translation}")
                 continue
 
-            # get google translate baseline
-            try:
-                translator = GoogleTranslator(source='en', target=lang_code)
-                sentences = sent_tokenize(english_text)
-                translated_sentences = [translator.translate(sentence) for sentence in sentences]
-                google_translation = ' '.join(translated_sentences)
-                logging.debug(f"Google Translate for {lang_name}: '{google_translation}'")
-            except Exception as e:
-                logging.error(f"Google Translate error for {lang_name}: {e}")
-                st.error(f"Error translating with Google Translate for {lang_name}: {str(e)}")
+            # get google translate baseline, failing only this row for this language
+            if lang_name not in google_cache:
+                google_cache[lang_name] = None
+                try:
+                    if sentences is None:
+                        sentences = sent_tokenize(english_text)
+                    google_translation = _google_translate_sentences(translators[language_codes[lang_name]], language_codes[lang_name], sentences)
+                    logging.debug(f"Google Translate for {lang_name}: '{google_translation}'")
+                    google_tokens = _TOK_RE.findall(google_translation.lower())
+                    google_cache[lang_name] = (google_translation, google_tokens, set(google_tokens), len(google_tokens))
+                except Exception as e:
+                    logging.error(f"Google Translate error for {lang_name}: {e}")
+                    st.error(f"Error translating with Google Translate for {lang_name}: {str(e)}")
+            if google_cache[lang_name] is None:
                 continue
+            google_translation, google_tokens, google_set, lg = google_cache[lang_name]
 
             # tokenize translations for scoring
             try:
-                app_tokens = word_tokenize(app_translation.lower())
-                google_tokens = word_tokenize(google_translation.lower())
+                app_tokens = _TOK_RE.findall(app_translation.lower())
             except Exception as e:
                 logging.error(f"Tokenization failed for {col}: {e}")
                 st.warning(f"Tokenization failed for {col}: {str(e)}. Skipping.")
                 continue
 
-            # compute bleu score
-            try:
-                bleu = sentence_bleu([google_tokens], app_tokens)
-                logging.debug(f"BLEU score for {col}: {bleu}")
-            except Exception as e:
-                logging.error(f"BLEU computation failed for {col}: {e}")
-                bleu = f"Error: {str(e)}"
+            # collect tokens so bleu can be computed for all rows in one pass
+            bleu_references.append(google_tokens)
+            bleu_hypotheses.append(app_tokens)
 
             # compute meteor score
             try:
-                meteor = meteor_score([google_tokens], app_tokens)
+                meteor = single_meteor_score(google_tokens, app_tokens)
                 logging.debug(f"METEOR score for {col}: {meteor}")
             except Exception as e:
                 logging.error(f"METEOR computation failed for {col}: {e}")
                 meteor = f"Error: {str(e)}"
 
             # calculate fluency score based on word count ratio
-            wc_app = len(app_tokens)
-            wc_google = len(google_tokens)
-            fluency_score = min(wc_app / wc_google, wc_google / wc_app) if wc_app > 0 and wc_google > 0 else 0
+            app_set = set(app_tokens)
+            la = len(app_tokens)
+            fluency_score = min(la / lg, lg / la) if la and lg else 0
             logging.debug(f"Fluency score for {col}: {fluency_score}")
 
             # calculate word matching percentage
-            app_words = set(app_tokens)
-            google_words = set(google_tokens)
-            intersection = app_words.intersection(google_words)
-            word_matching = len(intersection) / len(app_words) if len(app_words) > 0 else 0
+            word_matching = len(app_set & google_set) / len(app_set) if app_set else 0
             logging.debug(f"Word Matching for {col}: {word_matching}")
 
             evaluation_data.append({
@@ -304,27 +607,29 @@ def evaluate_dataset(uploaded_file):
                 "Language": lang_name,
                 "Application Translation": app_translation,
                 "Google Translate Translation": google_translation,
-                "BLEU Score": bleu,
+                "BLEU Score": None,
                 "METEOR Score": meteor,
                 "Fluency Score": fluency_score,
                 "Word Matching Percentage": word_matching
             })
 
         # update progress bar
-        progress_bar.progress((index + 1) / total_rows)
+        progress_bar.progress((position + 1) / total_rows)
 
-    # display and offer download of evaluation results
+    # compute bleu scores for all evaluated pairs at once
+    try:
+        bleu_scores = batch_sentence_bleu(bleu_references, bleu_hypotheses)
+    except Exception as e:
+        logging.error(f"BLEU computation failed: {e}")
+        bleu_scores = [f"Error: {str(e)}"] * len(evaluation_data)
+    for record, bleu in zip(evaluation_data, bleu_scores):
+        record["BLEU Score"] = bleu
+    logging.debug(f"BLEU scores: {bleu_scores}")
+
+    # return evaluation results for the app to display and offer for download
     if evaluation_data:
         evaluation_df = pd.DataFrame(evaluation_data)
-        st.dataframe(evaluation_df)
-        csv = evaluation_df.to_csv(index=False, encoding="utf-8-sig")
-        st.download_button(
-            "Download Evaluation CSV",
-            data=csv,
-            file_name="evaluation.csv",
-            mime="text/csv"
-        )
-        logging.info("Evaluation completed and results saved")
-    else:
-        logging.warning("No evaluation data generated")
-        st.warning("No evaluation data generated.")
\ No newline at end of file
+        logging.info("Evaluation completed")
+        return evaluation_df
+    logging.warning("No evaluation data generated")
+    st.warning("No evaluation data generated.")